@@ -1,23 +1,144 @@
 #!/usr/bin/env python3
 
+import gc
+import json
 import logging
+import os
+import threading
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from itertools import islice
 from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import urlopen
 
 import fire
+import websocket
 from selenium import webdriver
+from selenium.common.exceptions import (
+    JavascriptException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
 from tqdm import tqdm
-from undetected_chromedriver import Chrome
+from undetected_chromedriver import Chrome, ChromeOptions
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="\n>> %(message)s")
 logger = logging.getLogger(__name__)
 
 
+def read_batch_size(default: int = 10) -> int:
+    """
+    Read the batch size from the `MAGESPACE_IMPORTER_BATCH_SIZE` environment variable.
+
+    Args:
+        default (int): The batch size to use if the variable is unset or invalid.
+
+    Returns:
+        int: A positive batch size.
+    """
+    value = os.environ.get("MAGESPACE_IMPORTER_BATCH_SIZE")
+    if value is None:
+        return default
+    try:
+        batch_size = int(value)
+    except ValueError:
+        batch_size = 0
+    if batch_size < 1:
+        logger.warning(
+            f"MAGESPACE_IMPORTER_BATCH_SIZE must be a positive integer, not {value!r}. "
+            f"Using {default}."
+        )
+        return default
+    return batch_size
+
+
+# Number of model URLs to read and open per batch
+BATCH_SIZE = read_batch_size()
+
+# Hosts that mage.space can import models from
+ALLOWED_HOSTS = ("civitai.com", "huggingface.co")
+
+# Locator of the URL input field on the import page
+_INPUT_LOCATOR = (By.CSS_SELECTOR, "input[type='text']")
+
+# Reports whether Firebase Auth has persisted a signed-in user for the page.
+# The auth helper iframe is present for logged-out visitors too, so it cannot be used.
+# IndexedDB is only opened if it exists, because opening it would create it empty.
+_AUTH_USER_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const isAuthUser = key => String(key).startsWith("firebase:authUser:");
+if (Object.keys(localStorage).some(isAuthUser)
+    || Object.keys(sessionStorage).some(isAuthUser)) {
+    return done(true);
+}
+indexedDB.databases().then(databases => {
+    if (!databases.some(database => database.name === "firebaseLocalStorageDb")) {
+        return done(false);
+    }
+    const request = indexedDB.open("firebaseLocalStorageDb");
+    request.onerror = () => done(false);
+    request.onsuccess = () => {
+        const database = request.result;
+        if (!database.objectStoreNames.contains("firebaseLocalStorage")) {
+            database.close();
+            return done(false);
+        }
+        const keys = database
+            .transaction("firebaseLocalStorage", "readonly")
+            .objectStore("firebaseLocalStorage")
+            .getAllKeys();
+        keys.onerror = () => { database.close(); done(false); };
+        keys.onsuccess = () => { database.close(); done(keys.result.some(isAuthUser)); };
+    };
+}, () => done(false));
+"""
+
+# Submits the import form that contains the URL input passed as the first argument
+_SUBMIT_SCRIPT = """
+const form = arguments[0].form;
+if (!form) {
+    throw new Error("The URL input is not inside a form");
+}
+const button = form.querySelector("button[type='submit']");
+if (button) {
+    button.click();
+} else {
+    form.requestSubmit();
+}
+"""
+
+# Status messages, e.g. toasts, that the import page may show after a submit
+_SUCCESS_LOCATOR = (By.CSS_SELECTOR, "[role='status']")
+_ERROR_LOCATOR = (By.CSS_SELECTOR, "[role='alert']")
+
+
+def is_valid_url(url: str) -> bool:
+    """
+    Check if a URL is an http(s) URL on one of the allowed hosts.
+
+    Args:
+        url (str): The URL to check.
+
+    Returns:
+        bool: True if the URL can be imported, False otherwise.
+    """
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    return parsed.scheme in ("http", "https") and any(
+        host == allowed or host.endswith(f".{allowed}") for allowed in ALLOWED_HOSTS
+    )
+
+
 class MagespaceModelImporter:
     """A class to import models from a list of URLs into mage.space."""
 
@@ -26,6 +147,9 @@ class MagespaceModelImporter:
         models_path: Path | str | None = None,
         driver_path: Path | str | None = None,
         url_import: str | None = None,
+        num_browsers: int = 1,
+        single_tab: bool = False,
+        stealth: bool = False,
     ):
         """
         Initialize the MagespaceModelImporter class.
@@ -34,6 +158,9 @@ class MagespaceModelImporter:
             models_path (Path | str | None): Path to the file containing model URLs.
             driver_path (Path | str | None): Path to the ChromeDriver executable.
             url_import (str | None): URL to the model import page.
+            num_browsers (int): Number of Chrome instances to distribute the URLs across.
+            single_tab (bool): Submit each import automatically in one reused tab.
+            stealth (bool): Start Chrome through undetected_chromedriver.
         """
         self.models_path = (
             Path(models_path).resolve()
@@ -45,8 +172,14 @@ class MagespaceModelImporter:
                 f"You must have the file\n{self.models_path}\nthat contains a newline-delimited list of model URLs."
             )
             return
-        self.driver = self.initialize_driver(driver_path)
+        self.stealth = stealth
+        self._enter_pressed = threading.Event()
+        self._enter_reader: threading.Thread | None = None
+        self.drivers = self.initialize_drivers(driver_path, max(1, int(num_browsers)))
+        self.driver = self.drivers[0]
         self.url_import = url_import or "https://www.mage.space/models/import"
+        self.single_tab = single_tab
+        self.unconfirmed_urls: list[str] = []
         self.run()
 
     def initialize_driver(self, driver_path: Path | str | None) -> webdriver.Chrome:
@@ -59,145 +192,557 @@ class MagespaceModelImporter:
         Returns:
             webdriver.Chrome: An instance of Chrome WebDriver.
         """
-        if driver_path:
-            driver = Chrome(executable_path=str(Path(driver_path).resolve()))
+        options = self.get_chrome_options()
+        executable_path = str(Path(driver_path).resolve()) if driver_path else None
+        if self.stealth:
+            if executable_path:
+                driver = Chrome(
+                    options=options, driver_executable_path=executable_path
+                )
+            else:
+                driver = Chrome(options=options)
         else:
-            driver = Chrome()
+            driver = webdriver.Chrome(
+                options=options, service=Service(executable_path=executable_path)
+            )
+        # Element lookups return immediately, all waiting is done explicitly
+        driver.implicitly_wait(0)
         return driver
 
-    def is_logged_in(self) -> bool:
+    def get_chrome_options(self) -> webdriver.ChromeOptions:
         """
-        Check if the user is logged in.
+        Build Chrome options that skip resources the import page does not need.
 
         Returns:
-            bool: True if logged in, False otherwise.
+            webdriver.ChromeOptions: The options to start Chrome with.
         """
-        logger.info(
-            "Please log into mage.space using your account, then click here and press Enter"
+        options = ChromeOptions() if self.stealth else webdriver.ChromeOptions()
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
         )
-        input(">>> Waiting for Enter...")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        # Let one script open a whole batch of tabs
+        options.add_argument("--disable-popup-blocking")
+        # Return from `get` on DOMContentLoaded instead of waiting for the full load
+        options.page_load_strategy = "eager"
+        return options
+
+    def initialize_drivers(
+        self, driver_path: Path | str | None, num_browsers: int = 1
+    ) -> list[webdriver.Chrome]:
+        """
+        Initialize and return a pool of Chrome WebDrivers.
+
+        Args:
+            driver_path (Path | str | None): Path to the ChromeDriver executable.
+            num_browsers (int): Number of Chrome instances to start.
 
+        Returns:
+            list[webdriver.Chrome]: A list of Chrome WebDriver instances.
+        """
+        return [self.initialize_driver(driver_path) for _ in range(num_browsers)]
+
+    def is_logged_in(
+        self, timeout: int = 300, driver: webdriver.Chrome | None = None
+    ) -> bool:
+        """
+        Wait for the user to log in.
+
+        Args:
+            timeout (int): Time in seconds to wait for the login.
+            driver (webdriver.Chrome | None): The browser to check, defaults to the first one.
+
+        Returns:
+            bool: True if logged in or the user pressed Enter to continue, False otherwise.
+        """
+        driver = driver or self.driver
+        logger.info(
+            "Please log into mage.space using your account. The import starts once "
+            "you're logged in, or press Enter here if it doesn't."
+        )
+        self._enter_pressed.clear()
+        if self._enter_reader is None:
+            self._enter_reader = threading.Thread(
+                target=self.read_enter_presses, daemon=True
+            )
+            self._enter_reader.start()
         try:
-            self.driver.find_element(
-                By.CSS_SELECTOR,
-                "iframe[src*='https://www.mage.space/__/auth/iframe']",
+            WebDriverWait(driver, timeout, poll_frequency=0.5).until(
+                lambda driver: self._enter_pressed.is_set()
+                or self.has_auth_user(driver)
             )
-            logger.info("Logged in successfully.")
-            return True
-        except Exception as e:
+        except TimeoutException:
             logger.error("Error logging in")
             return False
+        if self._enter_pressed.is_set() and not self.has_auth_user(driver):
+            logger.warning("Continuing without a detected login.")
+            return True
+        logger.info("Logged in successfully.")
+        return True
+
+    def has_auth_user(self, driver: webdriver.Chrome) -> bool:
+        """
+        Check if the page has a signed-in Firebase Auth user.
+
+        Args:
+            driver (webdriver.Chrome): The browser to check.
+
+        Returns:
+            bool: True if a signed-in user was found, False otherwise.
+        """
+        try:
+            return bool(driver.execute_async_script(_AUTH_USER_SCRIPT))
+        except JavascriptException:
+            return False
 
-    def open_new_tab(self, url: str) -> None:
+    def read_enter_presses(self) -> None:
+        """
+        Set the Enter event each time the user presses Enter in the terminal.
         """
-        Open a new tab in the browser with the specified URL.
+        try:
+            while True:
+                input()
+                self._enter_pressed.set()
+        except EOFError:
+            # No terminal to read from, rely on detecting the login
+            return
+
+    def open_new_tabs(
+        self,
+        urls: list[str],
+        timeout: int = 10,
+        driver: webdriver.Chrome | None = None,
+    ) -> list[str]:
+        """
+        Open a new tab for each of the specified URLs in a single script call.
 
         Args:
-            url (str): URL to open in the new tab.
+            urls (list[str]): URLs to open, one per new tab.
+            timeout (int): Time in seconds to wait for all new tabs to be registered.
+            driver (webdriver.Chrome | None): The browser to use, defaults to the first one.
+
+        Returns:
+            list[str]: The window handles of the newly opened tabs.
         """
-        self.driver.execute_script("window.open('');")
-        self.driver.switch_to.window(self.driver.window_handles[-1])
-        self.driver.get(url)
+        driver = driver or self.driver
+        known_handles = set(driver.window_handles)
+        driver.execute_script(
+            "arguments[0].forEach(url => window.open(url));", urls
+        )
 
-    def wait_for_element(self, selector: str, timeout: int = 10) -> WebElement:
+        def new_handles(driver: webdriver.Chrome) -> list[str]:
+            return [
+                handle
+                for handle in driver.window_handles
+                if handle not in known_handles
+            ]
+
+        def all_tabs_opened(driver: webdriver.Chrome) -> list[str] | bool:
+            handles = new_handles(driver)
+            return handles if len(handles) >= len(urls) else False
+
+        # Chrome registers the opened windows asynchronously
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                all_tabs_opened
+            )
+        except TimeoutException:
+            return new_handles(driver)
+
+    def wait_for_element(
+        self,
+        locator: tuple[str, str],
+        timeout: int = 10,
+        driver: webdriver.Chrome | None = None,
+    ) -> WebElement:
         """
         Wait for an element to be visible and return it.
 
         Args:
-            selector (str): CSS selector of the element to wait for.
+            locator (tuple[str, str]): `By` strategy and selector of the element to wait for.
             timeout (int): Time in seconds to wait for the element.
+            driver (webdriver.Chrome | None): The browser to use, defaults to the first one.
 
         Returns:
             WebElement: The found web element.
         """
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, selector)))
+        wait = WebDriverWait(driver or self.driver, timeout)
+        return wait.until(EC.visibility_of_element_located(locator))
+
+    def find_input_field(self, driver: webdriver.Chrome) -> WebElement:
+        """
+        Return the URL input field of the import page in the current tab.
 
-    def process_model_url(self, model_url: str) -> None:
+        Args:
+            driver (webdriver.Chrome): The browser to use.
+
+        Returns:
+            WebElement: The URL input field.
+        """
+        self.wait_for_element(_INPUT_LOCATOR, driver=driver)
+        return WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable(_INPUT_LOCATOR)
+        )
+
+    def process_model_url(
+        self, model_url: str, driver: webdriver.Chrome | None = None
+    ) -> WebElement:
         """
-        Process a single model URL by opening a tab and entering the URL.
+        Process a single model URL by entering it into the import page in the current tab.
 
         Args:
             model_url (str): The model URL to process.
+            driver (webdriver.Chrome | None): The browser to use, defaults to the first one.
+
+        Returns:
+            WebElement: The input field that holds the model URL.
         """
-        self.open_new_tab(self.url_import)
-        time.sleep(1)
-        model_url_field = self.wait_for_element("input[type='text']")
-        model_url_field.clear()
-        model_url_field.send_keys(model_url)
-        time.sleep(1)
+        driver = driver or self.driver
+        model_url_field = self.find_input_field(driver)
+        # Set the value in one round-trip instead of one per keystroke. The native
+        # setter and the input event let framework-controlled inputs see the change.
+        driver.execute_script(
+            "const setter = Object.getOwnPropertyDescriptor("
+            "HTMLInputElement.prototype, 'value').set;"
+            "setter.call(arguments[0], arguments[1]);"
+            "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));",
+            model_url_field,
+            model_url,
+        )
         # Additional steps to process the model URL...
+        return model_url_field
 
-    def read_model_urls(self) -> list[str]:
+    def read_model_urls(self) -> Iterator[str]:
         """
-        Read model URLs from a file.
+        Lazily read model URLs from a file, skipping blank lines and duplicates.
+
+        Yields:
+            str: A model URL.
+        """
+        seen_urls = set()
+        with self.models_path.open() as f:
+            for line in f:
+                model_url = line.strip()
+                if model_url and model_url not in seen_urls:
+                    seen_urls.add(model_url)
+                    yield model_url
+
+    def count_model_urls(self) -> int:
+        """
+        Count the model URLs in the file without keeping them in memory.
 
         Returns:
-            list[str]: A list of model URLs.
+            int: The number of model URLs.
         """
-        return self.models_path.read_text().splitlines()
+        return sum(1 for _ in self.read_model_urls())
 
-    def process_urls(self, model_urls: list[str]) -> list[str]:
+    def process_urls(
+        self, model_urls: Iterable[str], total: int | None = None
+    ) -> list[str]:
         """
-        Process multiple model URLs.
+        Process multiple model URLs in batches of `BATCH_SIZE`.
 
         Args:
-            model_urls (list[str]): A list of model URLs to process.
+            model_urls (Iterable[str]): The model URLs to process.
+            total (int | None): The number of model URLs, for the progress bar.
 
         Returns:
             list[str]: A list of URLs that failed to process.
         """
+        num_browsers = len(self.drivers)
+        model_urls = iter(model_urls)
         error_urls = []
-        for model_url in tqdm(
-            model_urls,
-            total=len(model_urls),
+        with tqdm(
+            total=total,
             desc="Opening tabs for models",
             unit="url",
-        ):
+        ) as pbar:
+            with ThreadPoolExecutor(max_workers=num_browsers) as executor:
+                while batch := list(islice(model_urls, BATCH_SIZE)):
+                    valid_urls, invalid_urls = [], []
+                    for url in batch:
+                        (valid_urls if is_valid_url(url) else invalid_urls).append(url)
+                    if invalid_urls:
+                        logger.error(f"Skipping invalid URLs: {invalid_urls}")
+                        error_urls.extend(invalid_urls)
+                        pbar.update(len(invalid_urls))
+                    shards = [
+                        valid_urls[i::num_browsers] for i in range(num_browsers)
+                    ]
+                    results = executor.map(
+                        lambda driver, shard: self.process_shard(driver, shard, pbar),
+                        self.drivers,
+                        shards,
+                    )
+                    error_urls.extend(
+                        url for shard_errors in results for url in shard_errors
+                    )
+                    gc.collect()
+        return error_urls
+
+    def process_shard(
+        self, driver: webdriver.Chrome, model_urls: list[str], pbar: tqdm
+    ) -> list[str]:
+        """
+        Process a subset of model URLs in one browser.
+
+        Args:
+            driver (webdriver.Chrome): The browser that processes this shard.
+            model_urls (list[str]): The model URLs assigned to this browser.
+            pbar (tqdm): The shared progress bar to update.
+
+        Returns:
+            list[str]: A list of URLs that failed to process.
+        """
+        if not model_urls:
+            return []
+        if self.single_tab:
+            return self.process_shard_in_single_tab(driver, model_urls, pbar)
+        try:
+            handles = self.open_new_tabs(
+                [self.url_import] * len(model_urls), driver=driver
+            )
+        except Exception as e:
+            logger.error(f"Error opening tabs: {e}")
+            handles = []
+        error_urls = model_urls[len(handles) :]
+        for handle, model_url in zip(handles, model_urls):
             try:
-                self.process_model_url(model_url)
+                driver.switch_to.window(handle)
+                self.process_model_url(model_url, driver=driver)
             except Exception as e:
                 logger.error(f"Error processing URL {model_url}: {e}")
                 error_urls.append(model_url)
+            pbar.update(1)
+        pbar.update(len(model_urls) - len(handles))
         return error_urls
 
+    def process_shard_in_single_tab(
+        self, driver: webdriver.Chrome, model_urls: list[str], pbar: tqdm
+    ) -> list[str]:
+        """
+        Import a subset of model URLs one after another in the current tab.
+
+        Args:
+            driver (webdriver.Chrome): The browser that processes this shard.
+            model_urls (list[str]): The model URLs assigned to this browser.
+            pbar (tqdm): The shared progress bar to update.
+
+        Returns:
+            list[str]: A list of URLs that failed to process.
+        """
+        error_urls = []
+        for model_url in model_urls:
+            try:
+                if not self.submit_model_url(model_url, driver=driver):
+                    logger.warning(f"Submitted URL {model_url}, but got no response")
+                    self.unconfirmed_urls.append(model_url)
+            except Exception as e:
+                logger.error(f"Error importing URL {model_url}: {e}")
+                error_urls.append(model_url)
+            pbar.update(1)
+        return error_urls
+
+    def submit_model_url(
+        self, model_url: str, timeout: int = 30, driver: webdriver.Chrome | None = None
+    ) -> bool:
+        """
+        Load the import page in the current tab, enter the model URL and submit it.
+
+        The import counts as confirmed when the page clears the field or shows a new
+        status message. A new alert, or the field being marked invalid, is an error.
+
+        Args:
+            model_url (str): The model URL to import.
+            timeout (int): Time in seconds to wait for the import page to react.
+            driver (webdriver.Chrome | None): The browser to use, defaults to the first one.
+
+        Returns:
+            bool: True if the import was confirmed, False if the page did not respond.
+
+        Raises:
+            RuntimeError: If the import page reported an error.
+        """
+        driver = driver or self.driver
+        driver.get(self.url_import)
+        model_url_field = self.process_model_url(model_url, driver=driver)
+        known_messages = set(driver.find_elements(*_SUCCESS_LOCATOR))
+        known_messages.update(driver.find_elements(*_ERROR_LOCATOR))
+        driver.execute_script(_SUBMIT_SCRIPT, model_url_field)
+
+        def new_message(driver: webdriver.Chrome, locator: tuple[str, str]) -> str:
+            for message in driver.find_elements(*locator):
+                if message not in known_messages and message.text.strip():
+                    return message.text.strip()
+            return ""
+
+        def import_outcome(driver: webdriver.Chrome) -> tuple[bool, str] | bool:
+            if error := new_message(driver, _ERROR_LOCATOR):
+                return False, error
+            if model_url_field.get_attribute("aria-invalid") == "true":
+                return False, "The import page rejected the URL"
+            if success := new_message(driver, _SUCCESS_LOCATOR):
+                return True, success
+            if not model_url_field.get_attribute("value"):
+                return True, ""
+            return False
+
+        # A page that navigates away leaves the field stale and is not a confirmation
+        try:
+            imported, message = WebDriverWait(
+                driver,
+                timeout,
+                poll_frequency=0.5,
+                ignored_exceptions=[StaleElementReferenceException],
+            ).until(import_outcome)
+        except TimeoutException:
+            return False
+        if not imported:
+            raise RuntimeError(message)
+        return True
+
+    def count_open_tabs(self) -> int:
+        """
+        Count the open tabs across all browsers.
+
+        A browser whose last tab was closed has exited and counts as having none.
+
+        Returns:
+            int: The total number of open tabs.
+        """
+        tab_count = 0
+        for driver in self.drivers:
+            with suppress(WebDriverException):
+                tab_count += len(driver.window_handles)
+        return tab_count
+
+    def watch_closed_tabs(
+        self, driver: webdriver.Chrome, tab_closed: threading.Event
+    ) -> websocket.WebSocket:
+        """
+        Subscribe to the browser's DevTools target events and set `tab_closed`
+        whenever a target is destroyed.
+
+        The events are read from Chrome's own DevTools socket in a background thread,
+        so waiting for them costs no WebDriver commands.
+
+        Args:
+            driver (webdriver.Chrome): The browser to watch.
+            tab_closed (threading.Event): The event to set when a tab closes.
+
+        Returns:
+            websocket.WebSocket: The DevTools connection, to be closed when done.
+        """
+        debugger_address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        with urlopen(f"http://{debugger_address}/json/version") as response:
+            browser_url = json.load(response)["webSocketDebuggerUrl"]
+        connection = websocket.create_connection(browser_url, suppress_origin=True)
+        connection.send(
+            json.dumps(
+                {
+                    "id": 1,
+                    "method": "Target.setDiscoverTargets",
+                    "params": {"discover": True},
+                }
+            )
+        )
+
+        def listen() -> None:
+            try:
+                while True:
+                    message = json.loads(connection.recv())
+                    if message.get("method") == "Target.targetDestroyed":
+                        tab_closed.set()
+            except Exception:
+                # The connection was closed, by us or because the browser exited
+                tab_closed.set()
+
+        threading.Thread(target=listen, daemon=True).start()
+        return connection
+
     def wait_for_manual_processing(self) -> None:
         """
         Wait for the user to manually process and close tabs.
         """
         logger.info("Please finish each import and close each tab!")
-        initial_tab_count = len(self.driver.window_handles)
-        previous_tab_count = initial_tab_count
-
-        with tqdm(total=initial_tab_count, desc="Closed tabs", unit="tab") as pbar:
-            while len(self.driver.window_handles) > 0:
-                current_tab_count = len(self.driver.window_handles)
-                tabs_closed = previous_tab_count - current_tab_count
-                if tabs_closed > 0:
-                    pbar.update(tabs_closed)
-                    previous_tab_count = current_tab_count
-                time.sleep(1)
+        tab_closed = threading.Event()
+        connections = []
+        try:
+            try:
+                for driver in self.drivers:
+                    connections.append(self.watch_closed_tabs(driver, tab_closed))
+            except Exception as e:
+                logger.warning(f"Could not watch tab events, polling instead: {e}")
+            watching = len(connections) == len(self.drivers)
+
+            initial_tab_count = self.count_open_tabs()
+            previous_tab_count = initial_tab_count
+            idle_rounds = 0
+
+            with tqdm(
+                total=initial_tab_count,
+                desc="Closed tabs",
+                unit="tab",
+                miniters=1,
+                smoothing=0,
+            ) as pbar:
+                while True:
+                    tab_closed.clear()
+                    current_tab_count = self.count_open_tabs()
+                    tabs_closed = previous_tab_count - current_tab_count
+                    if tabs_closed > 0:
+                        pbar.update(tabs_closed)
+                        previous_tab_count = current_tab_count
+                        idle_rounds = 0
+                    else:
+                        idle_rounds = min(idle_rounds + 1, 5)
+                    if current_tab_count == 0:
+                        break
+                    if watching:
+                        # Wake up on target events, with a rare re-check as a safety net
+                        tab_closed.wait(30.0)
+                    else:
+                        # Poll quickly right after a tab was closed, back off while idle
+                        time.sleep(min(2.0, 0.1 * 2**idle_rounds))
+        finally:
+            for connection in connections:
+                connection.close()
 
     def run(self) -> None:
         """
         Run the model importing process.
         """
-        self.driver.get(self.url_import)
-        if self.is_logged_in():
-            model_urls = self.read_model_urls()
-            error_urls = self.process_urls(model_urls)
-            if error_urls:
-                logger.error(f"Failed URLs: {error_urls}")
-
-            self.wait_for_manual_processing()
-            logger.info("Finished processing all models!")
-        self.driver.quit()
+        try:
+            for driver in self.drivers:
+                driver.get(self.url_import)
+            if all([self.is_logged_in(driver=driver) for driver in self.drivers]):
+                error_urls = self.process_urls(
+                    self.read_model_urls(), total=self.count_model_urls()
+                )
+                if error_urls:
+                    logger.error(f"Failed URLs: {error_urls}")
+                if self.unconfirmed_urls:
+                    logger.warning(
+                        "Submitted, but unconfirmed URLs (check them on mage.space "
+                        f"before retrying): {self.unconfirmed_urls}"
+                    )
+
+                if not self.single_tab:
+                    self.wait_for_manual_processing()
+                logger.info("Finished processing all models!")
+        finally:
+            for driver in self.drivers:
+                with suppress(WebDriverException):
+                    driver.quit()
 
 
 def import_models_to_magespace(
     models_path: Path | str | None = None,
     driver_path: Path | str | None = None,
     url_import: str | None = None,
+    num_browsers: int = 1,
+    single_tab: bool = False,
+    stealth: bool = False,
 ) -> None:
     """
     Helps importing models from a list of URLs into https://mage.space/
@@ -238,6 +783,9 @@ def import_models_to_magespace(
     - `--models_path`: Path to the text file containing model URLs (one URL per line), defaults to `magespace.txt` in the current folder.
     - `--driver_path`: Optional path to the ChromeDriver executable.
     - `--url_import`: Custom URL for the model import page, defaults to `https://www.mage.space/models/import`.
+    - `--num_browsers`: Number of Chrome windows to open the URLs in, in parallel, defaults to 1. You need to log in in each window.
+    - `--single_tab`: Instead of opening a tab per URL, load the import page in one tab, enter each URL and submit it automatically. Keeps memory use flat for long lists. URLs that were submitted but got no response from the page are listed separately from failed ones, so check them before retrying.
+    - `--stealth`: Start Chrome through `undetected_chromedriver`, which hides browser automation from the site but starts slower.
 
     Example:
 
@@ -252,7 +800,9 @@ def import_models_to_magespace(
     ```
 
     """
-    importer = MagespaceModelImporter(models_path, driver_path, url_import)
+    importer = MagespaceModelImporter(
+        models_path, driver_path, url_import, num_browsers, single_tab, stealth
+    )
 
 
 def cli():